@@ -1,13 +1,15 @@
+from collections.abc import Buffer
 from typing import Protocol, Self, TypedDict
 
 class _SSZDeserializableObject(Protocol):
     @classmethod
-    def from_ssz(cls, i: bytes) -> Self: ...
+    def from_ssz(cls, i: Buffer) -> Self: ...
     @classmethod
-    def from_json(cls, i: bytes) -> Self: ...
+    def from_json(cls, i: Buffer) -> Self: ...
 
 class _SSZObject(_SSZDeserializableObject):
     def to_ssz(self) -> bytes: ...
+    def to_ssz_into(self, buf: bytearray) -> int: ...
     def to_json(self) -> bytes: ...
 
 class BlockHeaderDict(TypedDict):
@@ -6,44 +6,87 @@ This script compares preset values for Gnosis (local), Mainnet, and Minimal (ups
 Exits with a non-0 exit code if one or more mismatches are found.
 """
 
+import io
+import os
 import re
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final, Mapping
 from urllib.request import Request, urlopen
 
 import yaml
 
-# Mapping of typenum values to integers
-TYPENUM_MAP = {}
-for py_int in (
-    1,
-    2,
-    4,
-    8,
-    16,
-    17,
-    32,
-    64,
-    128,
-    256,
-    512,
-    1024,
-    2048,
-    4096,
-    8192,
-    65_536,
-    262_144,
-    1_048_576,
-    134_217_728,
-    16_777_216,
-    1_073_741_824,
-    1_099_511_627_776,
-):
-    TYPENUM_MAP[f"U{py_int}"] = py_int
+try:
+    # libyaml's C loader is several times faster than the pure-Python one.
+    # CBaseLoader has the same semantics as BaseLoader: every scalar stays a
+    # string, which is what parse_yaml_value expects.
+    from yaml import CBaseLoader as YamlLoader
+except ImportError:
+    from yaml import BaseLoader as YamlLoader
+
+# Mapping of typenum values to integers. Immutable: the rest of the module
+# treats it as a frozen constant.
+TYPENUM_MAP: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        f"U{py_int}": py_int
+        for py_int in (
+            1,
+            2,
+            4,
+            8,
+            16,
+            17,
+            32,
+            64,
+            128,
+            256,
+            512,
+            1024,
+            2048,
+            4096,
+            8192,
+            65_536,
+            262_144,
+            1_048_576,
+            134_217_728,
+            16_777_216,
+            1_073_741_824,
+            1_099_511_627_776,
+        )
+    }
+)
 
 GRANDINE_TAG = "2.0.1"
-GRANDINE_PRESET_FILE_CONTENT = ""
+
+# Precompiled patterns, shared by the extractors below. Compiling once at import
+# avoids re-entering the re module's pattern cache on every call.
+_ITEM_RE = re.compile(
+    r"type\s+(?P<tname>\w+)\s*=\s*(?P<tval>U\d+);"
+    r"|const\s+(?P<cname>\w+)\s*:\s*(?:NonZeroU64|u64|Gwei|usize|u8)\s*=\s*(?P<cval>.+?);"
+)
+_TRAIT_RE = re.compile(r"pub trait Preset.*?\{(.*?)\n\}", re.DOTALL)
+# Impl-block patterns for the upstream presets, precompiled per preset so no
+# pattern string is built at call time
+_IMPL_BLOCK_RE = {
+    "mainnet": re.compile(r"impl\s+Preset\s+for\s+Mainnet\s*\{(.*?)\n\}", re.DOTALL),
+    "minimal": re.compile(r"impl\s+Preset\s+for\s+Minimal\s*\{(.*?)\n\}", re.DOTALL),
+}
+_DELEGATE_RE = re.compile(
+    r"delegate_preset_items!\s*\{\s*super\s+Mainnet;([^}]+)\}", re.DOTALL
+)
+# These three run against const value strings that have already had the
+# digit-separator underscores stripped (see _parse_rust_const)
+_NZ_BANG_RE = re.compile(r"nonzero!\((\d+)u64\)")
+_NZ_MIN_RE = re.compile(r"NonZeroU64::MIN")
+_NZ_NEW_RE = re.compile(r"NonZeroU64::new\((\d+)\)")
+_SHIFT_RE = re.compile(r"(\d+)u?\d*\s*<<\s*(\d+)")
+_YAML_EXPR_RE = re.compile(r"\(\=\s*([0-9,]+)\s*\)")
+_YAML_POWER_RE = re.compile(r"(\d[\d,]*)")
+_CAMEL1 = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL2 = re.compile(r"([a-z0-9])([A-Z])")
 
 # Preset configurations
 PRESETS = {
@@ -65,40 +108,21 @@ PRESETS = {
 }
 
 
+@lru_cache(maxsize=None)
 def camel_to_snake(name: str) -> str:
     """Convert CamelCase to UPPER_SNAKE_CASE.
 
+    Handles acronym and digit boundaries ("ETHVoting" -> "ETH_VOTING",
+    "ETH1Voting" -> "ETH1_VOTING"). Memoized because each name is converted
+    both for the forward check and the reverse check.
+
     Examples:
         SlotsPerEpoch -> SLOTS_PER_EPOCH
         MaxAttestations -> MAX_ATTESTATIONS
         EpochsPerHistoricalVector -> EPOCHS_PER_HISTORICAL_VECTOR
         EpochsPerEth1VotingPeriod -> EPOCHS_PER_ETH1_VOTING_PERIOD
     """
-    result = []
-    for i, char in enumerate(name):
-        if char.isupper():
-            # Check if we need to insert an underscore before this uppercase letter
-            if i > 0:
-                prev_char = name[i - 1]
-                next_char = name[i + 1] if i + 1 < len(name) else ""
-                # Case 1: Previous char is lowercase (e.g., "slotsE" -> "SLOTS_E")
-                # Case 2: Previous char is uppercase AND next char is lowercase
-                #         (e.g., "ETHVoting" at 'V' -> "ETH_VOTING")
-                # Case 3: Previous char is a digit AND next char is lowercase
-                #         (e.g., "ETH1Voting" at 'V' -> "ETH1_VOTING")
-                if prev_char.islower():
-                    result.append("_")
-                elif prev_char.isupper() and next_char and next_char.islower():
-                    result.append("_")
-                elif prev_char.isdigit() and next_char and next_char.islower():
-                    result.append("_")
-            result.append(char.upper())
-        elif char.isdigit():
-            # Digits: just append them (they're part of acronyms like ETH1)
-            result.append(char)
-        else:
-            result.append(char.upper())
-    return "".join(result)
+    return _CAMEL2.sub(r"\1_\2", _CAMEL1.sub(r"\1_\2", name)).upper()
 
 
 def parse_yaml_value(raw_value: Any, key: str) -> int | None:
@@ -113,8 +137,15 @@ def parse_yaml_value(raw_value: Any, key: str) -> int | None:
     # If it's a string, try to parse it
     if isinstance(raw_value, str):
         value_str = raw_value.strip()
-        # Remove inline comments
-        value_str = value_str.split("#")[0].strip()
+
+        # Fast path: the overwhelming majority of values are bare integers,
+        # so don't pay for comment stripping or the expression regexes
+        if value_str.isdigit():
+            return int(value_str)
+
+        # Remove inline comments; partition stops at the first "#" and doesn't
+        # allocate a list (or anything at all when there is no comment)
+        value_str = value_str.partition("#")[0].strip()
 
         # Try direct integer parsing (handle commas)
         try:
@@ -123,12 +154,12 @@ def parse_yaml_value(raw_value: Any, key: str) -> int | None:
             pass
 
         # Parse expressions like "2**6 (= 64)" or "2**0 * 10**9 (= 1,000,000,000)"
-        expr_match = re.search(r"\(\=\s*([0-9,]+)\s*\)", value_str)
+        expr_match = _YAML_EXPR_RE.search(value_str)
         if expr_match:
             return int(expr_match.group(1).replace(",", ""))
 
         # Parse raw power expressions
-        power_match = re.search(r"(\d[\d,]*)", value_str)
+        power_match = _YAML_POWER_RE.search(value_str)
         if power_match:
             return int(power_match.group(1).replace(",", ""))
 
@@ -136,223 +167,183 @@ def parse_yaml_value(raw_value: Any, key: str) -> int | None:
     raise RuntimeError(f"Failed to parse YAML value for '{key}': {raw_value!r}")
 
 
-def extract_rust_types(rust_content: str, preset_name: str) -> dict[str, str]:
-    """Extract type definitions from Rust preset file."""
-    types = {}
+@lru_cache(maxsize=None)
+def _find_impl_block(preset_name: str, rust_content: str) -> str | None:
+    """Find the `impl Preset for <Name>` block contents for a preset.
 
-    if preset_name == "gnosis":
-        # For Gnosis, extract from impl Preset for Gnosis
-        pattern = r"type\s+(\w+)\s*=\s*(U\d+);"
-        for match in re.finditer(pattern, rust_content):
-            types[match.group(1)] = match.group(2)
-    else:
-        # For Mainnet/Minimal from upstream
-        cap_name = preset_name.capitalize()
-        impl_pattern = rf"impl\s+Preset\s+for\s+{cap_name}\s*\{{(.*?)\n\}}"
-        impl_match = re.search(impl_pattern, rust_content, re.DOTALL)
-
-        if impl_match:
-            impl_content = impl_match.group(1)
-
-            # First, handle delegate_preset_items! macro (Minimal delegates to Mainnet)
-            if preset_name == "minimal":
-                delegate_pattern = (
-                    r"delegate_preset_items!\s*\{\s*super\s+Mainnet;([^}]+)\}"
-                )
-                delegate_match = re.search(delegate_pattern, impl_content, re.DOTALL)
-                if delegate_match:
-                    # Extract delegated type names (they end with semicolon)
-                    for line in delegate_match.group(1).split("\n"):
-                        line = line.strip()
-                        if line.startswith("type ") and line.endswith(";"):
-                            type_name = line[5:-1]  # Remove "type " and ";"
-                            # These are delegated to Mainnet
-                            types[type_name] = "DELEGATED_TO_MAINNET"
-
-            # Extract explicit type definitions
-            pattern = r"type\s+(\w+)\s*=\s*(U\d+);"
-            for match in re.finditer(pattern, impl_content):
-                types[match.group(1)] = match.group(2)
-
-            # For Minimal, resolve delegated types from Mainnet
-            if preset_name == "minimal":
-                mainnet_types = {}
-                mainnet_impl_pattern = r"impl\s+Preset\s+for\s+Mainnet\s*\{(.*?)\n\}"
-                mainnet_match = re.search(mainnet_impl_pattern, rust_content, re.DOTALL)
-                if mainnet_match:
-                    mainnet_content = mainnet_match.group(1)
-                    for match in re.finditer(pattern, mainnet_content):
-                        mainnet_types[match.group(1)] = match.group(2)
-
-                # Resolve delegated types
-                for type_name, type_value in list(types.items()):
-                    if (
-                        type_value == "DELEGATED_TO_MAINNET"
-                        and type_name in mainnet_types
-                    ):
-                        types[type_name] = mainnet_types[type_name]
-
-    return types
+    Memoized so that the Mainnet block is located only once when Minimal
+    resolves its delegated items against it.
+    """
+    impl_match = _IMPL_BLOCK_RE[preset_name].search(rust_content)
+    return impl_match.group(1) if impl_match else None
 
 
-def extract_trait_defaults(rust_content: str) -> dict[str, int]:
-    """Extract default const values from the Preset trait definition."""
-    consts = {}
+@lru_cache(maxsize=None)
+def _scan_items(content: str) -> tuple[dict[str, str], dict[str, str]]:
+    """Collect type and const definitions from a Rust block in a single pass.
 
-    # Find the trait definition
-    trait_pattern = r"pub trait Preset.*?\{(.*?)\n\}"
-    trait_match = re.search(trait_pattern, rust_content, re.DOTALL)
-    if not trait_match:
-        return consts
+    Returns (types, consts) where types maps type name to typenum and consts
+    maps const name to its raw (unparsed) value expression. Memoized because
+    extract_rust_types and extract_rust_consts scan the same blocks.
+    """
+    types: dict[str, str] = {}
+    consts: dict[str, str] = {}
+    # Item access (match[...]) dispatches straight to Match.__getitem__,
+    # avoiding the .group attribute lookup per match.
+    for match in _ITEM_RE.finditer(content):
+        if match.lastgroup == "tval":
+            types[match["tname"]] = match["tval"]
+        else:
+            consts[match["cname"]] = match["cval"].strip()
+    return types, consts
 
-    trait_content = trait_match.group(1)
 
-    # Match pattern like "const BASE_REWARD_FACTOR: u64 = 64;" with default value
-    pattern = r"const\s+(\w+)\s*:\s*(?:NonZeroU64|u64|Gwei|usize|u8)\s*=\s*(.+?);"
-    for match in re.finditer(pattern, trait_content):
-        name = match.group(1)
-        value_str = match.group(2).strip()
+def _parse_rust_const(name: str, value_str: str, context: str) -> int:
+    """Parse a Rust const value expression into an integer."""
+    # In Rust integer literals, underscores are only digit separators; strip
+    # them once so every branch below works on the cleaned string and the
+    # captured groups can be fed to int() directly
+    clean = value_str.replace("_", "")
 
-        # Handle simple integer values
-        try:
-            consts[name] = int(value_str.replace("_", ""))
-            continue
-        except ValueError:
-            pass
+    # Handle simple integer values
+    if clean.isdigit():
+        return int(clean)
 
-        # Handle nonzero!(value_u64) syntax - with or without underscores
-        nz_match = re.search(r"nonzero!\((\d[\d_]*)_u64\)", value_str)
-        if nz_match:
-            consts[name] = int(nz_match.group(1).replace("_", ""))
-            continue
-
-        # Handle NonZeroU64::new(x).unwrap() or NonZeroU64::MIN
-        nz_min_match = re.search(r"NonZeroU64::MIN", value_str)
-        if nz_min_match:
-            consts[name] = 1
-            continue
-
-        nz_new_match = re.search(r"NonZeroU64::new\((\d[\d_]*)\)", value_str)
-        if nz_new_match:
-            consts[name] = int(nz_new_match.group(1).replace("_", ""))
-            continue
-
-        # Handle bit shifts like "1_u64 << 26"
-        shift_match = re.search(r"(\d+)_?u?\d*\s*<<\s*(\d+)", value_str)
-        if shift_match:
-            consts[name] = int(shift_match.group(1)) << int(shift_match.group(2))
-            continue
-
-        # If we get here, we couldn't parse the value - raise an error
-        raise RuntimeError(
-            f"Failed to parse Rust trait default for '{name}': {value_str!r}"
-        )
+    # Handle nonzero!(value_u64) syntax
+    nz_match = _NZ_BANG_RE.search(clean)
+    if nz_match:
+        return int(nz_match.group(1))
 
-    return consts
+    # Handle NonZeroU64::new(x).unwrap() or NonZeroU64::MIN
+    if _NZ_MIN_RE.search(clean):
+        return 1
 
+    nz_new_match = _NZ_NEW_RE.search(clean)
+    if nz_new_match:
+        return int(nz_new_match.group(1))
 
-def extract_rust_consts(rust_content: str, preset_name: str) -> dict[str, int]:
-    """Extract const definitions from Rust preset file."""
-    consts = {}
+    # Handle bit shifts like "1_u64 << 26"
+    shift_match = _SHIFT_RE.search(clean)
+    if shift_match:
+        return int(shift_match.group(1)) << int(shift_match.group(2))
 
+    # If we get here, we couldn't parse the value - raise an error
+    raise RuntimeError(
+        f"Failed to parse Rust const for '{name}' in {context}: {value_str!r}"
+    )
+
+
+def extract_rust_types(
+    rust_content: str, preset_name: str
+) -> dict[str, tuple[str, str]]:
+    """Extract type definitions from Rust preset file.
+
+    Maps each type name to (snake_case_name, typenum); the snake-case YAML
+    key is computed here, once, so callers don't convert names a second time
+    for the reverse check.
+    """
     if preset_name == "gnosis":
-        content_to_search = rust_content
-        # Match pattern like "const BASE_REWARD_FACTOR: u64 = 25;"
-        pattern = r"const\s+(\w+)\s*:\s*(?:NonZeroU64|u64|Gwei|usize|u8)\s*=\s*(.+?);"
-        for match in re.finditer(pattern, content_to_search):
-            name = match.group(1)
-            value_str = match.group(2).strip()
+        # For Gnosis, extract from impl Preset for Gnosis
+        types = dict(_scan_items(rust_content)[0])
+        return {
+            name: (camel_to_snake(name), typenum) for name, typenum in types.items()
+        }
+
+    # For Mainnet/Minimal from upstream
+    impl_content = _find_impl_block(preset_name, rust_content)
+    if impl_content is None:
+        return {}
+
+    types: dict[str, str] = {}
+
+    # First, handle delegate_preset_items! macro (Minimal delegates to Mainnet).
+    # Delegated names resolve directly against the Mainnet impl block, whose
+    # lookup and scan are both cached from the Mainnet preset's own run.
+    if preset_name == "minimal":
+        delegate_match = _DELEGATE_RE.search(impl_content)
+        if delegate_match:
+            mainnet_content = _find_impl_block("mainnet", rust_content)
+            mainnet_types = (
+                _scan_items(mainnet_content)[0] if mainnet_content is not None else {}
+            )
 
-            # Handle simple integer values
-            try:
-                consts[name] = int(value_str.replace("_", ""))
-                continue
-            except ValueError:
-                pass
+            # Extract delegated type names (they end with semicolon)
+            for line in delegate_match.group(1).split("\n"):
+                line = line.strip()
+                if line.startswith("type ") and line.endswith(";"):
+                    type_name = line[5:-1]  # Remove "type " and ";"
+                    # Keep a marker for items Mainnet doesn't define, so the
+                    # comparison reports them instead of dropping them
+                    types[type_name] = mainnet_types.get(
+                        type_name, "DELEGATED_TO_MAINNET"
+                    )
 
-            # Handle NonZeroU64::new(x).unwrap() - with or without underscores
-            nz_match = re.search(r"NonZeroU64::new\((\d[\d_]*)\)", value_str)
+    # Extract explicit type definitions (overriding any delegated ones)
+    types.update(_scan_items(impl_content)[0])
 
-            if nz_match:
-                consts[name] = int(nz_match.group(1).replace("_", ""))
-                continue
+    return {name: (camel_to_snake(name), typenum) for name, typenum in types.items()}
 
-            # Handle bit shifts like "1_u64 << 13"
-            shift_match = re.search(r"(\d+)_?u?\d*\s*<<\s*(\d+)", value_str)
-            if shift_match:
-                consts[name] = int(shift_match.group(1)) << int(shift_match.group(2))
-                continue
 
-            # If we get here, we couldn't parse the value - raise an error
-            raise RuntimeError(
-                f"Failed to parse Rust const for '{name}' in Gnosis preset: {value_str!r}"
-            )
-    else:
-        # For Mainnet/Minimal from upstream
-        # First get default trait values
-        trait_defaults = extract_trait_defaults(rust_content)
-
-        # For Mainnet, it uses all trait defaults
-        if preset_name == "mainnet":
-            consts = trait_defaults.copy()
-
-        # For Minimal, get the impl block overrides
-        elif preset_name == "minimal":
-            consts = trait_defaults.copy()  # Start with defaults
-
-            # Find Minimal impl block
-            impl_pattern = r"impl\s+Preset\s+for\s+Minimal\s*\{(.*?)\n\}"
-            impl_match = re.search(impl_pattern, rust_content, re.DOTALL)
-            if impl_match:
-                impl_content = impl_match.group(1)
-
-                # Match const overrides in Minimal impl
-                pattern = (
-                    r"const\s+(\w+)\s*:\s*(?:NonZeroU64|u64|Gwei|usize|u8)\s*=\s*(.+?);"
-                )
-                for match in re.finditer(pattern, impl_content):
-                    name = match.group(1)
-                    value_str = match.group(2).strip()
-
-                    # Handle simple integer values
-                    try:
-                        consts[name] = int(value_str.replace("_", ""))
-                        continue
-                    except ValueError:
-                        pass
-
-                    # Handle nonzero!(value_u64) syntax
-                    nz_match = re.search(r"nonzero!\((\d+)_u64\)", value_str)
-                    if nz_match:
-                        consts[name] = int(nz_match.group(1))
-                        continue
-
-                    # Handle bit shifts like "1_u64 << 25"
-                    shift_match = re.search(r"(\d+)_?u?\d*\s*<<\s*(\d+)", value_str)
-                    if shift_match:
-                        consts[name] = int(shift_match.group(1)) << int(
-                            shift_match.group(2)
-                        )
-                        continue
-
-                    # If we get here, we couldn't parse the value - raise an error
-                    raise RuntimeError(
-                        f"Failed to parse Rust const for '{name}' in Minimal preset: {value_str!r}"
-                    )
+def extract_trait_defaults(rust_content: str) -> dict[str, int]:
+    """Extract default const values from the Preset trait definition."""
+    # Find the trait definition
+    trait_match = _TRAIT_RE.search(rust_content)
+    if not trait_match:
+        return {}
+
+    # Match pattern like "const BASE_REWARD_FACTOR: u64 = 64;" with default value
+    return {
+        name: _parse_rust_const(name, value_str, "trait defaults")
+        for name, value_str in _scan_items(trait_match.group(1))[1].items()
+    }
+
+
+def extract_rust_consts(rust_content: str, preset_name: str) -> dict[str, int]:
+    """Extract const definitions from Rust preset file."""
+    if preset_name == "gnosis":
+        # Match pattern like "const BASE_REWARD_FACTOR: u64 = 25;"
+        return {
+            name: _parse_rust_const(name, value_str, "Gnosis preset")
+            for name, value_str in _scan_items(rust_content)[1].items()
+        }
+
+    # For Mainnet/Minimal from upstream, start from the default trait values;
+    # Mainnet uses them as-is
+    consts = extract_trait_defaults(rust_content)
+
+    # For Minimal, apply the impl block overrides
+    if preset_name == "minimal":
+        impl_content = _find_impl_block("minimal", rust_content)
+        if impl_content is not None:
+            for name, value_str in _scan_items(impl_content)[1].items():
+                consts[name] = _parse_rust_const(name, value_str, "Minimal preset")
 
     return consts
 
 
-def load_yaml_values(presets_dir: Path) -> dict[str, int]:
-    """Load all relevant values from YAML preset files."""
+def load_yaml_values(
+    presets_dir: Path, wanted_keys: set[str] | None = None
+) -> dict[str, Any]:
+    """Load all relevant values from YAML preset files.
+
+    When `wanted_keys` is given, values of keys outside it are stored raw
+    (unparsed): such keys can only ever surface in the reverse check, which
+    needs their names but never their parsed values.
+    """
     values = {}
 
     # Use all YAML files in the directory
     yaml_files = [f for f in presets_dir.iterdir() if f.suffix == ".yaml"]
 
-    for filepath in yaml_files:
-        with filepath.open() as f:
-            parsed = yaml.load(f, yaml.BaseLoader)  # noqa: S506 - trusted input, BaseLoader is safe
+    # Read all files concurrently so the C loader can parse one buffer while
+    # the remaining reads are still in flight.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        raw_contents = list(executor.map(lambda p: (p, p.read_bytes()), yaml_files))
+
+    for filepath, data in raw_contents:
+        # Hand the loader a single bytes buffer; the C loader parses it in
+        # one pass without Python-level read calls.
+        parsed = yaml.load(data, YamlLoader)  # noqa: S506 - trusted input, (C)BaseLoader is safe
 
         if not isinstance(parsed, dict):
             raise TypeError(f"Expected a dict from {filepath.name}, got {type(parsed)}")
@@ -361,6 +352,10 @@ def load_yaml_values(presets_dir: Path) -> dict[str, int]:
         for key, raw_value in parsed.items():
             if key.startswith("#") or not isinstance(key, str):
                 continue
+            if wanted_keys is not None and key not in wanted_keys:
+                if raw_value is not None:
+                    values[key] = raw_value
+                continue
             try:
                 val = parse_yaml_value(raw_value, key)
             except RuntimeError:
@@ -378,11 +373,21 @@ Mismatch = namedtuple(
 )
 
 
-def verify_preset(preset_name: str, config: dict) -> tuple[int, list[Mismatch]]:
-    """Verify a single preset. Returns (total, matched, mismatches)."""
-    print(f"\n{'=' * 70}")
-    print(f"Verifying {preset_name.capitalize()} Preset")
-    print(f"{'=' * 70}")
+def verify_preset(
+    preset_name: str, config: dict, rust_content: str = ""
+) -> tuple[int, list[Mismatch]]:
+    """Verify a single preset. Returns (total, matched, mismatches).
+
+    For non-local presets, `rust_content` is the upstream Rust preset file
+    content; local presets read their Rust file from the worktree instead.
+
+    Output is buffered locally and flushed in one go so that concurrent
+    verification of several presets doesn't interleave report lines.
+    """
+    out = io.StringIO()
+    print(f"\n{'=' * 70}", file=out)
+    print(f"Verifying {preset_name.capitalize()} Preset", file=out)
+    print(f"{'=' * 70}", file=out)
 
     # Get worktree path (parent of scripts directory)
     script_dir = Path(__file__).parent.resolve()
@@ -393,28 +398,38 @@ def verify_preset(preset_name: str, config: dict) -> tuple[int, list[Mismatch]]:
     # Load Rust content
     if config["is_local"]:
         rust_file = pwd / config["rust_file"]
-        print(f"📖 Reading local Rust preset from: {rust_file}")
+        print(f"📖 Reading local Rust preset from: {rust_file}", file=out)
         with open(rust_file, "r") as f:
             rust_content = f.read()
-    else:
-        rust_content = GRANDINE_PRESET_FILE_CONTENT
 
     rust_types = extract_rust_types(rust_content, preset_name)
     rust_consts = extract_rust_consts(rust_content, preset_name)
 
-    print(f"   Found {len(rust_types)} type definitions")
-    print(f"   Found {len(rust_consts)} const definitions")
+    print(f"   Found {len(rust_types)} type definitions", file=out)
+    print(f"   Found {len(rust_consts)} const definitions", file=out)
+
+    # The only YAML values whose parsed form is ever consulted are the ones
+    # matching a Rust definition plus the inputs of the computed parameters;
+    # everything else just needs its key for the reverse check
+    rust_type_keys = {yaml_key for yaml_key, _ in rust_types.values()}
+    all_rust_keys = rust_type_keys | set(rust_consts.keys())
+    wanted_keys = all_rust_keys | {
+        "SLOTS_PER_HISTORICAL_ROOT",
+        "SLOTS_PER_EPOCH",
+        "FIELD_ELEMENTS_PER_EXT_BLOB",
+        "FIELD_ELEMENTS_PER_CELL",
+    }
 
     # Load YAML values
-    print(f"📖 Reading YAML presets from: {presets_dir}")
-    yaml_values = load_yaml_values(presets_dir)
-    print(f"   Found {len(yaml_values)} preset values")
+    print(f"📖 Reading YAML presets from: {presets_dir}", file=out)
+    yaml_values = load_yaml_values(presets_dir, wanted_keys)
+    print(f"   Found {len(yaml_values)} preset values", file=out)
 
     # Compare type-level values
     mismatches: list[Mismatch] = []
     type_params_checked = 0
 
-    for rust_name, rust_typenum in rust_types.items():
+    for rust_name, (yaml_key, rust_typenum) in rust_types.items():
         # Handle computed parameters
         if rust_name == "EpochsPerHistoricalRoot":
             yaml_val = (
@@ -429,8 +444,7 @@ def verify_preset(preset_name: str, config: dict) -> tuple[int, list[Mismatch]]:
             )
             source = "computed"
         else:
-            # Convert CamelCase Rust name to UPPER_SNAKE_CASE YAML key
-            yaml_key = camel_to_snake(rust_name)
+            # The extractor already converted the Rust name to the YAML key
             yaml_val = yaml_values.get(yaml_key)
             source = yaml_key
 
@@ -473,11 +487,6 @@ def verify_preset(preset_name: str, config: dict) -> tuple[int, list[Mismatch]]:
             mismatches.append(Mismatch(rust_name, yaml_val, rust_val, None))
 
     # Check for YAML values that don't have corresponding Rust definitions
-    # Build set of all Rust-defined keys (types converted to snake_case + consts)
-    rust_type_keys = {camel_to_snake(name) for name in rust_types.keys()}
-    rust_const_keys = set(rust_consts.keys())
-    all_rust_keys = rust_type_keys | rust_const_keys
-
     # YAML keys that are not used in the Rust codebase
     yaml_inputs_unused_in_rust = {
         "SLOTS_PER_HISTORICAL_ROOT",  # Rust computes EpochsPerHistoricalRoot and uses that
@@ -489,32 +498,40 @@ def verify_preset(preset_name: str, config: dict) -> tuple[int, list[Mismatch]]:
         "CELLS_PER_EXT_BLOB",  # Computed from FIELD_ELEMENTS_PER_EXT_BLOB // FIELD_ELEMENTS_PER_CELL
     }
 
-    reverse_check_ok = True
-    for yaml_key in sorted(yaml_values.keys()):
-        if yaml_key in yaml_inputs_unused_in_rust or yaml_key in computed_config_keys:
-            continue
-        if yaml_key not in all_rust_keys:
+    missing_in_rust = (
+        yaml_values.keys()
+        - all_rust_keys
+        - yaml_inputs_unused_in_rust
+        - computed_config_keys
+    )
+    if missing_in_rust:
+        for yaml_key in sorted(missing_in_rust):
             mismatches.append(
                 Mismatch(yaml_key, yaml_values[yaml_key], None, "missing in Rust")
             )
-            reverse_check_ok = False
-
-    if reverse_check_ok:
-        print("✅ All YAML values are defined in Rust")
+    else:
+        print("✅ All YAML values are defined in Rust", file=out)
 
     total = type_params_checked + const_params_checked
 
+    print(out.getvalue(), end="")
+
     return total, mismatches
 
 
-def main() -> None:
-    global GRANDINE_PRESET_FILE_CONTENT
-    """Main entry point. Returns exit code."""
-    print("=" * 70)
-    print("Gnosis, Mainnet, and Minimal Preset Verification")
-    print("=" * 70)
+def _download_upstream_preset() -> str:
+    """Download the upstream Rust preset file content for GRANDINE_TAG.
+
+    Since GRANDINE_TAG pins an immutable tag, the downloaded content is cached
+    on disk and reused on subsequent runs, skipping the network entirely.
+    """
+    cache_path = (
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / f"grandine-py/preset-{GRANDINE_TAG}.rs"
+    )
+    if cache_path.exists():
+        return cache_path.read_text()
 
-    # Download upstream Rust preset file content
     req = Request(
         f"https://raw.githubusercontent.com/grandinetech/grandine/refs/tags/{GRANDINE_TAG}/types/src/preset.rs"
     )
@@ -523,15 +540,43 @@ def main() -> None:
             raise RuntimeError(
                 f"Failed to retrieve Rust preset file content: {response.status}, {response.read()}"
             )
-        GRANDINE_PRESET_FILE_CONTENT = response.read().decode("utf-8")
+        content = response.read().decode("utf-8")
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(content)
+    return content
+
+
+def main() -> None:
+    """Main entry point. Returns exit code."""
+    print("=" * 70)
+    print("Gnosis, Mainnet, and Minimal Preset Verification")
+    print("=" * 70)
 
     all_preset_mismatches: list[tuple[str, Mismatch]] = []
     total_params = 0
 
-    for preset_name, config in PRESETS.items():
-        total, mismatches = verify_preset(preset_name, config)
-        total_params += total
-        all_preset_mismatches.extend([(preset_name, m) for m in mismatches])
+    # The presets are fully independent, so verify them concurrently. Threads
+    # are enough here: the hot parts (network/file IO, YAML parsing, regex
+    # scans) all release the GIL or spend their time in C code. Gnosis doesn't
+    # need the upstream download, so it starts right away and hides the
+    # network latency; mainnet/minimal wait for the downloaded content.
+    with ThreadPoolExecutor(max_workers=len(PRESETS) + 1) as executor:
+        download_future = executor.submit(_download_upstream_preset)
+
+        futures = {
+            "gnosis": executor.submit(verify_preset, "gnosis", PRESETS["gnosis"])
+        }
+        upstream_content = download_future.result()
+        for preset_name in ("mainnet", "minimal"):
+            futures[preset_name] = executor.submit(
+                verify_preset, preset_name, PRESETS[preset_name], upstream_content
+            )
+
+        for preset_name, future in futures.items():
+            total, mismatches = future.result()
+            total_params += total
+            all_preset_mismatches.extend([(preset_name, m) for m in mismatches])
 
     # Final summary
     print("\n" + "=" * 70)
@@ -46,6 +46,7 @@ pub fn encode_ssz<T: SszWrite>(value: &T) -> Result<Vec<u8>, String> {
 ///
 /// * `from_ssz` - Deserialize from SSZ bytes
 /// * `to_ssz` - Serialize to SSZ bytes
+/// * `to_ssz_into` - Serialize SSZ into a caller-provided bytearray
 /// * `from_json` - Deserialize from JSON bytes (requires `DeserializeOwned`)
 /// * `to_json` - Serialize to JSON bytes (requires `Serialize`)
 ///
@@ -76,13 +77,16 @@ macro_rules! define_ssz_pyclass_for_preset {
             #[staticmethod]
             /// Deserialize from SSZ-encoded bytes.
             ///
+            /// Accepts any object supporting the buffer protocol (`bytes`,
+            /// `bytearray`, `memoryview`, `mmap`, ...).
+            ///
             /// # Errors
             /// Returns `PyValueError` if deserialization fails.
             pub fn from_ssz(
                 py: pyo3::Python<'_>,
-                b: &pyo3::Bound<'_, pyo3::types::PyBytes>,
+                b: pyo3::buffer::PyBuffer<u8>,
             ) -> pyo3::PyResult<Self> {
-                let bytes = b.as_bytes().to_vec();
+                let bytes = b.to_vec(py)?;
                 let inner: $rust_ty = py
                     .detach(|| $crate::decode_ssz(&bytes))
                     .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
@@ -92,18 +96,19 @@ macro_rules! define_ssz_pyclass_for_preset {
             #[staticmethod]
             /// Deserialize from JSON-encoded bytes.
             ///
-            /// Expects JSON in the format `{"data": <value>}`.
+            /// Expects JSON in the format `{"data": <value>}`. Accepts any
+            /// object supporting the buffer protocol.
             ///
             /// # Errors
             /// Returns `PyValueError` if deserialization fails.
             pub fn from_json(
                 py: pyo3::Python<'_>,
-                b: &pyo3::Bound<'_, pyo3::types::PyBytes>,
+                b: pyo3::buffer::PyBuffer<u8>,
             ) -> pyo3::PyResult<Self>
             where
                 $rust_ty: serde::de::DeserializeOwned,
             {
-                let bytes = b.as_bytes().to_vec();
+                let bytes = b.to_vec(py)?;
                 let env: $crate::JsonDataEnvelope<$rust_ty> = py
                     .detach(|| serde_json::from_slice(&bytes))
                     .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
@@ -126,6 +131,29 @@ macro_rules! define_ssz_pyclass_for_preset {
                 Ok(pyo3::types::PyBytes::new(py, &out).into())
             }
 
+            /// Serialize SSZ into a caller-provided `bytearray`, returning the
+            /// number of bytes written.
+            ///
+            /// The bytearray is resized to fit. Reusing one buffer across calls
+            /// avoids allocating a fresh `bytes` object per serialization.
+            ///
+            /// # Errors
+            /// Returns `PyValueError` if serialization fails.
+            pub fn to_ssz_into(
+                &self,
+                py: pyo3::Python<'_>,
+                buf: &pyo3::Bound<'_, pyo3::types::PyByteArray>,
+            ) -> pyo3::PyResult<usize> {
+                let inner_ref = &self.inner;
+                let out: Vec<u8> = py
+                    .detach(|| $crate::encode_ssz(inner_ref))
+                    .map_err(|e| pyo3::exceptions::PyValueError::new_err(e))?;
+                buf.resize(out.len())?;
+                // SAFETY: no Python code runs while the slice is held.
+                unsafe { buf.as_bytes_mut() }.copy_from_slice(&out);
+                Ok(out.len())
+            }
+
             /// Serialize to JSON-encoded bytes.
             ///
             /// # Errors
@@ -168,13 +196,16 @@ macro_rules! define_decodable_pyclass_for_preset {
             #[staticmethod]
             /// Deserialize from SSZ-encoded bytes.
             ///
+            /// Accepts any object supporting the buffer protocol (`bytes`,
+            /// `bytearray`, `memoryview`, `mmap`, ...).
+            ///
             /// # Errors
             /// Returns `PyValueError` if deserialization fails.
             pub fn from_ssz(
                 py: pyo3::Python<'_>,
-                b: &pyo3::Bound<'_, pyo3::types::PyBytes>,
+                b: pyo3::buffer::PyBuffer<u8>,
             ) -> pyo3::PyResult<Self> {
-                let bytes = b.as_bytes().to_vec();
+                let bytes = b.to_vec(py)?;
                 let inner: $rust_ty = py
                     .detach(|| ($ssz_decoder)(&bytes))
                     .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
@@ -184,13 +215,15 @@ macro_rules! define_decodable_pyclass_for_preset {
             #[staticmethod]
             /// Deserialize from JSON-encoded bytes.
             ///
+            /// Accepts any object supporting the buffer protocol.
+            ///
             /// # Errors
             /// Returns `PyValueError` if deserialization fails.
             pub fn from_json(
                 py: pyo3::Python<'_>,
-                b: &pyo3::Bound<'_, pyo3::types::PyBytes>,
+                b: pyo3::buffer::PyBuffer<u8>,
             ) -> pyo3::PyResult<Self> {
-                let bytes = b.as_bytes().to_vec();
+                let bytes = b.to_vec(py)?;
                 let env: $crate::JsonDataEnvelope<$rust_ty> = py
                     .detach(|| serde_json::from_slice(&bytes))
                     .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
@@ -1,5 +1,94 @@
+import mmap
+from collections.abc import Iterator
+from pathlib import Path
+
+import msgspec
 import pytest
 
+from grandine_py import ElectraBeaconBlockContentsMainnet
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _mmap_fixture(name: str) -> Iterator[memoryview]:
+    """Expose a fixture file as a read-only memoryview over an mmap.
+
+    from_ssz consumes it through the buffer protocol, so the file content is
+    never copied onto the heap; memoryview (unlike raw mmap) also compares
+    equal to the bytes the roundtrip tests produce.
+    """
+    try:
+        f = (FIXTURES_DIR / name).open("rb")
+    except FileNotFoundError:
+        pytest.skip(f"fixture {name} not available")
+    with f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    try:
+        yield view
+    finally:
+        view.release()
+        mm.close()
+
+
+def _read_fixture(name: str) -> bytes:
+    """Read a fixture file, skipping dependent tests if it is missing."""
+    try:
+        return (FIXTURES_DIR / name).read_bytes()
+    except FileNotFoundError:
+        pytest.skip(f"fixture {name} not available")
+
+
+@pytest.fixture(scope="session")
+def mainnet_block_ssz() -> Iterator[memoryview]:
+    yield from _mmap_fixture("mainnet-13689000.ssz")
+
+
+@pytest.fixture(scope="session")
+def gnosis_block_ssz() -> Iterator[memoryview]:
+    yield from _mmap_fixture("gnosis-26539000.ssz")
+
+
+@pytest.fixture(scope="session")
+def mainnet_block_json() -> bytes:
+    return _read_fixture("mainnet-13689000.json")
+
+
+@pytest.fixture(scope="session")
+def gnosis_block_json() -> bytes:
+    return _read_fixture("gnosis-26539000.json")
+
+
+@pytest.fixture(scope="session")
+def mainnet_block_contents_json(mainnet_block_json: bytes) -> bytes:
+    """Block-contents JSON (block + empty proofs/blobs) for the mainnet fixture.
+
+    Session-scoped so the ~MB signed block is decoded and re-encoded once
+    instead of in every test that builds block contents from it.
+    """
+    signed_block = msgspec.json.decode(mainnet_block_json)
+    return msgspec.json.encode(
+        {
+            "data": {
+                "block": signed_block["data"]["message"],
+                "kzg_proofs": [],
+                "blobs": [],
+            }
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def mainnet_block_contents(
+    mainnet_block_contents_json: bytes,
+) -> ElectraBeaconBlockContentsMainnet:
+    """Decoded block contents, shared across tests.
+
+    Safe to share: the exposed methods return new objects and never mutate
+    the receiver.
+    """
+    return ElectraBeaconBlockContentsMainnet.from_json(mainnet_block_contents_json)
+
 
 @pytest.fixture
 def builder_bid_json() -> dict[str, object]:
@@ -0,0 +1,39 @@
+"""Micro-benchmarks for the SSZ/JSON codecs on the mainnet block fixture.
+
+Excluded from default test runs; run with `uv run pytest -m benchmark`.
+Comparing runs across branches (`pytest-benchmark compare`) catches
+regressions in the Rust codec or the PyO3 glue.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from grandine_py import ElectraSignedBeaconBlockMainnet
+
+
+@pytest.mark.benchmark(group="ssz")
+def test_bench_from_ssz(
+    benchmark: BenchmarkFixture, mainnet_block_ssz: memoryview
+) -> None:
+    benchmark(ElectraSignedBeaconBlockMainnet.from_ssz, mainnet_block_ssz)
+
+
+@pytest.mark.benchmark(group="ssz")
+def test_bench_to_ssz(
+    benchmark: BenchmarkFixture, mainnet_block_ssz: memoryview
+) -> None:
+    block = ElectraSignedBeaconBlockMainnet.from_ssz(mainnet_block_ssz)
+    benchmark(block.to_ssz)
+
+
+@pytest.mark.benchmark(group="json")
+def test_bench_from_json(
+    benchmark: BenchmarkFixture, mainnet_block_json: bytes
+) -> None:
+    benchmark(ElectraSignedBeaconBlockMainnet.from_json, mainnet_block_json)
+
+
+@pytest.mark.benchmark(group="json")
+def test_bench_to_json(benchmark: BenchmarkFixture, mainnet_block_json: bytes) -> None:
+    block = ElectraSignedBeaconBlockMainnet.from_json(mainnet_block_json)
+    benchmark(block.to_json)
@@ -1,6 +1,7 @@
-import json
+from collections.abc import Callable
 from pathlib import Path
 
+import msgspec
 import pytest
 
 from grandine_py import (
@@ -12,79 +13,106 @@ from grandine_py import (
     ElectraSignedBuilderBidMinimal,
 )
 
+# One encoder and output buffer reused across tests: encode_into resizes the
+# buffer in place instead of allocating a fresh bytes object per encode, and
+# from_json copies out of the returned view during the call. Under
+# pytest-xdist each worker process has its own copy, so reuse stays safe.
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_BUF = bytearray(256 * 1024)
+
+
+def _encode_json(obj: object) -> memoryview:
+    _JSON_ENCODER.encode_into(obj, _JSON_BUF)
+    return memoryview(_JSON_BUF)
+
 
 @pytest.mark.parametrize(
-    ("block_cls", "path_to_ssz"),
+    ("block_cls", "ssz_fixture"),
     [
-        pytest.param(
-            ElectraSignedBeaconBlockMainnet,
-            Path(__file__).parent / "fixtures/mainnet-13689000.ssz",
-        ),
-        pytest.param(
-            ElectraSignedBeaconBlockGnosis,
-            Path(__file__).parent / "fixtures/gnosis-26539000.ssz",
-        ),
+        pytest.param(ElectraSignedBeaconBlockMainnet, "mainnet_block_ssz"),
+        pytest.param(ElectraSignedBeaconBlockGnosis, "gnosis_block_ssz"),
     ],
 )
 def test_ssz(
     block_cls: ElectraSignedBeaconBlockMainnet | ElectraSignedBeaconBlockGnosis,
-    path_to_ssz: Path,
+    ssz_fixture: str,
+    request: pytest.FixtureRequest,
+) -> None:
+    # One decode covers both serialization paths - to_ssz and to_ssz_into -
+    # since the decode dominates the test's cost
+    encoded = request.getfixturevalue(ssz_fixture)
+    decoded = block_cls.from_ssz(encoded)
+
+    re_encoded = decoded.to_ssz()
+    assert isinstance(re_encoded, bytes)
+    assert re_encoded == encoded
+
+    # A reused (here: preallocated) buffer avoids a fresh bytes allocation
+    # per serialization
+    buf = bytearray(len(encoded))
+    written = decoded.to_ssz_into(buf)
+    assert written == len(encoded)
+    assert bytes(buf) == encoded
+
+
+@pytest.mark.parametrize(
+    ("block_cls", "json_fixture"),
+    [
+        pytest.param(ElectraSignedBeaconBlockMainnet, "mainnet_block_json"),
+        pytest.param(ElectraSignedBeaconBlockGnosis, "gnosis_block_json"),
+    ],
+)
+def test_json(
+    block_cls: ElectraSignedBeaconBlockMainnet | ElectraSignedBeaconBlockGnosis,
+    json_fixture: str,
+    request: pytest.FixtureRequest,
 ) -> None:
-    with open(path_to_ssz, "rb") as f:
-        encoded = f.read()
-        decoded = block_cls.from_ssz(encoded)
-        assert decoded.to_ssz() == encoded
+    encoded = request.getfixturevalue(json_fixture)
+    decoded = block_cls.from_json(encoded)
+    re_encoded = decoded.to_json()
+    assert msgspec.json.decode(encoded)["data"] == msgspec.json.decode(re_encoded)
 
 
 @pytest.mark.parametrize(
-    ("block_cls", "path_to_json"),
+    ("decode", "payload"),
     [
         pytest.param(
-            ElectraSignedBeaconBlockMainnet,
-            Path(__file__).parent / "fixtures/mainnet-13689000.json",
+            ElectraSignedBeaconBlockMainnet.from_ssz, b"not valid ssz", id="ssz-garbage"
+        ),
+        pytest.param(ElectraSignedBeaconBlockMainnet.from_ssz, b"", id="ssz-empty"),
+        pytest.param(
+            ElectraSignedBeaconBlockMainnet.from_json,
+            b"not valid json",
+            id="json-garbage",
+        ),
+        pytest.param(
+            ElectraSignedBeaconBlockMainnet.from_json, b"{}", id="json-no-data"
         ),
         pytest.param(
-            ElectraSignedBeaconBlockGnosis,
-            Path(__file__).parent / "fixtures/gnosis-26539000.json",
+            ElectraSignedBeaconBlockMainnet.from_json,
+            b'{"data": {"message": {}, "signature": "0x00"}}',
+            id="json-missing-fields",
         ),
     ],
 )
-def test_json(
-    block_cls: ElectraSignedBeaconBlockMainnet | ElectraSignedBeaconBlockGnosis,
-    path_to_json: Path,
+def test_invalid_inputs_raise(
+    decode: Callable[[bytes], object], payload: bytes
 ) -> None:
-    with open(path_to_json, "rb") as f:
-        encoded = f.read()
-        decoded = block_cls.from_json(encoded)
-        re_encoded = decoded.to_json()
-        assert json.loads(encoded.decode())["data"] == json.loads(re_encoded.decode())
+    with pytest.raises(ValueError):
+        decode(payload)
 
 
 def test_replace_execution_payload_with_builder_bid_blinds_block_contents(
     builder_bid_json: dict[str, object],
+    mainnet_block_contents: ElectraBeaconBlockContentsMainnet,
 ) -> None:
-    with open(Path(__file__).parent / "fixtures/mainnet-13689000.json", "rb") as f:
-        signed_block = json.loads(f.read().decode())
-
-    block_contents = ElectraBeaconBlockContentsMainnet.from_json(
-        json.dumps(
-            {
-                "data": {
-                    "block": signed_block["data"]["message"],
-                    "kzg_proofs": [],
-                    "blobs": [],
-                }
-            }
-        ).encode()
-    )
-
     builder_bid = ElectraSignedBuilderBidMainnet.from_json(
-        json.dumps({"data": builder_bid_json}).encode()
+        _encode_json({"data": builder_bid_json})
     )
-    blinded_block = block_contents.replace_execution_payload_with_builder_bid(
+    blinded_block = mainnet_block_contents.replace_execution_payload_with_builder_bid(
         builder_bid
     )
-    blinded_json = json.loads(blinded_block.to_json().decode())
+    blinded_json = msgspec.json.decode(blinded_block.to_json())
 
     assert "execution_payload" not in blinded_json["body"]
     assert (
@@ -107,18 +135,18 @@ def test_replace_execution_payload_with_builder_bid_updates_blinded_block(
     with open(
         Path(__file__).parent / "fixtures/minimal-signed-blinded-block.json", "rb"
     ) as f:
-        signed_blinded_block = json.loads(f.read().decode())
+        signed_blinded_block = msgspec.json.decode(f.read())
 
     block = ElectraBlindedBeaconBlockMinimal.from_json(
-        json.dumps({"data": signed_blinded_block["data"]["message"]}).encode()
+        _encode_json({"data": signed_blinded_block["data"]["message"]})
     )
     original_blinded_body = signed_blinded_block["data"]["message"]["body"]
 
     builder_bid = ElectraSignedBuilderBidMinimal.from_json(
-        json.dumps({"data": builder_bid_json}).encode()
+        _encode_json({"data": builder_bid_json})
     )
     blinded_block = block.replace_execution_payload_with_builder_bid(builder_bid)
-    blinded_json = json.loads(blinded_block.to_json().decode())
+    blinded_json = msgspec.json.decode(blinded_block.to_json())
 
     assert (
         original_blinded_body["execution_payload_header"]
@@ -146,22 +174,9 @@ def test_replace_execution_payload_with_builder_bid_updates_blinded_block(
     )
 
 
-def test_replace_execution_payload_with_builder_bid_ssz_and_json_twins_match() -> None:
-    with open(Path(__file__).parent / "fixtures/mainnet-13689000.json", "rb") as f:
-        signed_block = json.loads(f.read())
-
-    block_contents = ElectraBeaconBlockContentsMainnet.from_json(
-        json.dumps(
-            {
-                "data": {
-                    "block": signed_block["data"]["message"],
-                    "kzg_proofs": [],
-                    "blobs": [],
-                }
-            }
-        ).encode()
-    )
-
+def test_replace_execution_payload_with_builder_bid_ssz_and_json_twins_match(
+    mainnet_block_contents: ElectraBeaconBlockContentsMainnet,
+) -> None:
     with open(
         Path(__file__).parent / "fixtures/mainnet-signed-builder-bid-slot-14149070.ssz",
         "rb",
@@ -174,13 +189,17 @@ def test_replace_execution_payload_with_builder_bid_ssz_and_json_twins_match() -
     ) as f:
         json_builder_bid = ElectraSignedBuilderBidMainnet.from_json(f.read())
 
-    blinded_from_ssz = block_contents.replace_execution_payload_with_builder_bid(
-        ssz_builder_bid
+    blinded_from_ssz = (
+        mainnet_block_contents.replace_execution_payload_with_builder_bid(
+            ssz_builder_bid
+        )
     )
-    blinded_from_json = block_contents.replace_execution_payload_with_builder_bid(
-        json_builder_bid
+    blinded_from_json = (
+        mainnet_block_contents.replace_execution_payload_with_builder_bid(
+            json_builder_bid
+        )
     )
 
-    assert json.loads(blinded_from_ssz.to_json()) == json.loads(
-        blinded_from_json.to_json()
-    )
+    # Both sides come from the same serializer, so byte equality is the exact
+    # comparison - no need to parse either document
+    assert blinded_from_ssz.to_json() == blinded_from_json.to_json()